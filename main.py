@@ -1,16 +1,233 @@
 import pymupdf as fitz  # PyMuPDF
 import os
-from PIL import Image
+from PIL import Image, ImageFilter
 import io
-import glob
+import functools
+import mmap
 import argparse
 import sys
-import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from collections import deque
+from itertools import islice, repeat
+from operator import itemgetter
+
+# Pages handed to an extraction worker at a time; smaller jobs run in-process
+_PAGES_PER_TASK = 4
+
+# Upper bound on pages rendered per compression task, which bounds how
+# many rendered pages can be held in memory at once
+_MAX_RENDER_CHUNK_PAGES = 4
+
+# Supported image formats
+_IMAGE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'})
+
+# Image formats PyMuPDF can embed directly from the file
+_DIRECT_INSERT_EXTS = frozenset({'.png', '.jpg', '.jpeg'})
+
+# Separable 3-tap [1/4, 1/2, 1/4] blur applied to low quality compressed pages
+_LOW_QUALITY_BLUR = ImageFilter.BoxBlur(radius=0.5)
+
+def _open_pdf_readonly(pdf_path):
+    """
+    Open a PDF for reading from a memory-mapped view of the file.
+    
+    MuPDF reads straight from the page cache instead of copying the file
+    through stdio buffers. The mapping stays alive as long as the returned
+    document (which holds the view) and is released with it.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+    
+    Returns:
+        fitz.Document: Opened document
+    """
+    with open(pdf_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Can't map an empty file; let PyMuPDF raise its usual error
+            return fitz.open(pdf_path)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return fitz.open(stream=memoryview(mm), filetype='pdf')
+    except fitz.FileDataError as e:
+        # Name the file, as opening by path would
+        raise fitz.FileDataError(f"Failed to open file '{pdf_path}' as type pdf.") from e
+
+@functools.lru_cache(maxsize=8)
+def _open_pdf_cached(pdf_path, file_key):
+    """Open a read-only document; cached per (path, file_key) by _open_pdf."""
+    return _open_pdf_readonly(pdf_path)
+
+def _open_pdf(pdf_path):
+    """
+    Get a shared read-only document for a PDF, reusing a recently opened one.
+    
+    Documents are cached per process. The key covers inode, size, mtime and
+    ctime, so a file replaced or rewritten in place is reopened even if its
+    mtime was preserved (cp -p, rsync -t); a cached document must never read
+    a mapping whose file has changed underneath it. Callers must not close
+    the returned document; it is released when evicted from the cache.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+    
+    Returns:
+        fitz.Document: Opened document
+    """
+    st = os.stat(pdf_path)
+    return _open_pdf_cached(pdf_path, (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns))
+
+def _get_max_workers(limit=8):
+    """Number of worker processes to use for per-page work."""
+    return min(os.cpu_count() or 1, limit)
+
+def _extract_raw_image(pdf_document, xref):
+    """
+    Get an embedded JPEG's original stream if it can be saved as-is.
+    
+    Args:
+        pdf_document (fitz.Document): Open PDF document
+        xref (int): Image xref
+    
+    Returns:
+        dict: Result of Document.extract_image, or None if the image needs
+        decoding (not a plain JPEG, CMYK, or has a soft mask)
+    """
+    # Check the stream filter first; extract_image would decode and
+    # re-encode anything that isn't stored as JPEG
+    if pdf_document.xref_get_key(xref, "Filter")[1] not in ("/DCTDecode", "[/DCTDecode]"):
+        return None
+    
+    info = pdf_document.extract_image(xref)
+    if not info or info["ext"] != "jpeg":
+        return None
+    if info["colorspace"] >= 4 or info["smask"] != 0:
+        return None
+    return info
+
+def _unique_page_images(pdf_document):
+    """
+    List the images to extract from each page, skipping xrefs already seen
+    on an earlier page (logos, headers and other reused assets).
+    
+    Args:
+        pdf_document (fitz.Document): Open PDF document
+    
+    Returns:
+        list: Per page, a list of (img_index, xref) for first occurrences
+    """
+    seen_xrefs = set()
+    page_images = []
+    
+    for page in pdf_document:
+        images = []
+        for img_index, img in enumerate(page.get_images(full=True)):
+            xref = img[0]
+            if xref in seen_xrefs:
+                continue
+            seen_xrefs.add(xref)
+            images.append((img_index, xref))
+        page_images.append(images)
+    
+    return page_images
+
+def _run_page_jobs(worker, pdf_path, page_images, *args):
+    """
+    Run an extraction worker over every page that has images to extract.
+    
+    Pages are spread across worker processes, unless there are too few of
+    them to fill more than one task, in which case they run in-process.
+    
+    Args:
+        worker (callable): Page worker taking (pdf_path, page_num, images, *args)
+        pdf_path (str): Path to the PDF file
+        page_images (list): Per page, a list of (img_index, xref) to extract
+        *args: Extra arguments passed to the worker
+    
+    Returns:
+        int: Total number of images extracted
+    """
+    jobs = [(page_num, images) for page_num, images in enumerate(page_images) if images]
+    
+    if len(jobs) <= _PAGES_PER_TASK:
+        return sum(worker(pdf_path, page_num, images, *args) for page_num, images in jobs)
+    
+    with ProcessPoolExecutor(max_workers=_get_max_workers()) as executor:
+        counts = executor.map(
+            worker,
+            repeat(pdf_path),
+            (page_num for page_num, _ in jobs),
+            (images for _, images in jobs),
+            *(repeat(arg) for arg in args),
+            chunksize=_PAGES_PER_TASK
+        )
+        return sum(counts)
+
+def _extract_all_page_images(pdf_path, page_num, images, output_folder, pdf_name):
+    """
+    Extract the given images of a single PDF page (runs in a worker process).
+    
+    Each worker opens its own document, as PyMuPDF documents cannot be
+    shared between processes; it is cached and reused for later pages.
+    
+    Returns:
+        int: Number of images extracted from the page
+    """
+    pdf_document = _open_pdf(pdf_path)
+    image_count = 0
+    
+    # Extract each image
+    for img_index, xref in images:
+        # Save JPEG streams as-is, without decoding and re-encoding
+        info = _extract_raw_image(pdf_document, xref)
+        if info is not None:
+            img_filename = f"{pdf_name}_page{page_num + 1}_img{img_index + 1}.{info['ext']}"
+            with open(os.path.join(output_folder, img_filename), "wb") as f:
+                f.write(info["image"])
+            
+            image_count += 1
+            print(f"Extracted: {img_filename}")
+            continue
+        
+        pix = fitz.Pixmap(pdf_document, xref)
+        
+        # Skip if image is a mask
+        if pix.n - pix.alpha < 4:  # GRAY or RGB
+            # Generate filename
+            img_filename = f"{pdf_name}_page{page_num + 1}_img{img_index + 1}.png"
+            img_path = os.path.join(output_folder, img_filename)
+            
+            # Save image
+            if pix.n - pix.alpha == 1:  # Grayscale
+                pix.save(img_path)
+            else:  # RGB
+                pix.save(img_path)
+            
+            image_count += 1
+            print(f"Extracted: {img_filename}")
+        
+        # Alternative method using PIL for better format handling
+        else:
+            # Convert to RGB if CMYK
+            if pix.n == 5:  # CMYK + alpha
+                pix = fitz.Pixmap(fitz.csRGB, pix)
+            
+            img_filename = f"{pdf_name}_page{page_num + 1}_img{img_index + 1}.png"
+            img_path = os.path.join(output_folder, img_filename)
+            pix.save(img_path)
+            image_count += 1
+            print(f"Extracted: {img_filename}")
+        
+        # Clean up
+        pix = None
+    
+    return image_count
 
 def extract_images_from_pdf(pdf_path, output_folder="extracted_images"):
     """
     Extract all images from a PDF file and save them to a specified folder.
     
+    Images reused on several pages are only saved for the first page.
+    
     Args:
         pdf_path (str): Path to the PDF file
         output_folder (str): Folder to save extracted images
@@ -18,62 +235,64 @@ def extract_images_from_pdf(pdf_path, output_folder="extracted_images"):
     Returns:
         int: Number of images extracted
     """
-    # Create output folder if it doesn't exist
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
+    # Open the PDF file to find each page's images, skipping repeats
+    pdf_document = _open_pdf(pdf_path)
+    page_images = _unique_page_images(pdf_document)
     
-    # Open the PDF file
-    pdf_document = fitz.open(pdf_path)
-    image_count = 0
+    # Create output folder if it doesn't exist
+    os.makedirs(output_folder, exist_ok=True)
     
     # Get the base name of the PDF file (without extension)
     pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
     
-    # Iterate through each page
-    for page_num in range(pdf_document.page_count):
-        page = pdf_document[page_num]
-        
-        # Get list of images on the page
-        image_list = page.get_images(full=True)
-        
-        # Extract each image
-        for img_index, img in enumerate(image_list):
-            # Get image data
-            xref = img[0]
-            pix = fitz.Pixmap(pdf_document, xref)
-            
-            # Skip if image is a mask
-            if pix.n - pix.alpha < 4:  # GRAY or RGB
-                # Generate filename
-                img_filename = f"{pdf_name}_page{page_num + 1}_img{img_index + 1}.png"
-                img_path = os.path.join(output_folder, img_filename)
-                
-                # Save image
-                if pix.n - pix.alpha == 1:  # Grayscale
-                    pix.save(img_path)
-                else:  # RGB
-                    pix.save(img_path)
+    # Extract each page, in worker processes when there is enough work
+    return _run_page_jobs(_extract_all_page_images, pdf_path, page_images, output_folder, pdf_name)
+
+def _extract_filtered_page_images(pdf_path, page_num, images, output_folder, pdf_name, min_width, min_height):
+    """
+    Extract the given images of a single PDF page that meet the minimum
+    dimensions (runs in a worker process).
+    
+    Returns:
+        int: Number of images extracted from the page
+    """
+    pdf_document = _open_pdf(pdf_path)
+    image_count = 0
+    
+    for img_index, xref in images:
+        # Save JPEG streams as-is, without decoding and re-encoding
+        info = _extract_raw_image(pdf_document, xref)
+        if info is not None:
+            width, height = info["width"], info["height"]
+            if width >= min_width and height >= min_height:
+                img_filename = f"{pdf_name}_page{page_num + 1}_img{img_index + 1}.{info['ext']}"
+                with open(os.path.join(output_folder, img_filename), "wb") as f:
+                    f.write(info["image"])
                 
                 image_count += 1
-                print(f"Extracted: {img_filename}")
-            
-            # Alternative method using PIL for better format handling
+                print(f"Extracted: {img_filename} ({width}x{height})")
             else:
-                # Convert to RGB if CMYK
-                if pix.n == 5:  # CMYK + alpha
-                    pix = fitz.Pixmap(fitz.csRGB, pix)
-                
-                img_filename = f"{pdf_name}_page{page_num + 1}_img{img_index + 1}.png"
-                img_path = os.path.join(output_folder, img_filename)
-                pix.save(img_path)
-                image_count += 1
-                print(f"Extracted: {img_filename}")
+                print(f"Skipped small image: {width}x{height} (minimum: {min_width}x{min_height})")
+            continue
+        
+        pix = fitz.Pixmap(pdf_document, xref)
+        
+        # Check image dimensions
+        if pix.width >= min_width and pix.height >= min_height:
+            # Handle different color spaces
+            if pix.n - pix.alpha == 4:  # CMYK
+                pix = fitz.Pixmap(fitz.csRGB, pix)
             
-            # Clean up
-            pix = None
-    
-    # Close the PDF
-    pdf_document.close()
+            img_filename = f"{pdf_name}_page{page_num + 1}_img{img_index + 1}.png"
+            img_path = os.path.join(output_folder, img_filename)
+            pix.save(img_path)
+            
+            image_count += 1
+            print(f"Extracted: {img_filename} ({pix.width}x{pix.height})")
+        else:
+            print(f"Skipped small image: {pix.width}x{pix.height} (minimum: {min_width}x{min_height})")
+        
+        pix = None
     
     return image_count
 
@@ -90,40 +309,58 @@ def extract_images_with_quality_filter(pdf_path, output_folder="extracted_images
     Returns:
         int: Number of images extracted
     """
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
+    pdf_document = _open_pdf(pdf_path)
+    page_images = _unique_page_images(pdf_document)
     
-    pdf_document = fitz.open(pdf_path)
-    image_count = 0
+    os.makedirs(output_folder, exist_ok=True)
     pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
     
-    for page_num in range(pdf_document.page_count):
-        page = pdf_document[page_num]
-        image_list = page.get_images(full=True)
-        
-        for img_index, img in enumerate(image_list):
-            xref = img[0]
-            pix = fitz.Pixmap(pdf_document, xref)
-            
-            # Check image dimensions
-            if pix.width >= min_width and pix.height >= min_height:
-                # Handle different color spaces
-                if pix.n - pix.alpha == 4:  # CMYK
-                    pix = fitz.Pixmap(fitz.csRGB, pix)
-                
-                img_filename = f"{pdf_name}_page{page_num + 1}_img{img_index + 1}.png"
-                img_path = os.path.join(output_folder, img_filename)
-                pix.save(img_path)
-                
-                image_count += 1
-                print(f"Extracted: {img_filename} ({pix.width}x{pix.height})")
-            else:
-                print(f"Skipped small image: {pix.width}x{pix.height} (minimum: {min_width}x{min_height})")
-            
-            pix = None
+    return _run_page_jobs(
+        _extract_filtered_page_images, pdf_path, page_images,
+        output_folder, pdf_name, min_width, min_height
+    )
+
+def _find_image_files(directory_path):
+    """
+    List supported image files in a directory with a single scandir pass.
     
-    pdf_document.close()
-    return image_count
+    Args:
+        directory_path (str): Path to directory containing images
+    
+    Returns:
+        list: Paths of image files (extension match is case-insensitive,
+        hidden files such as macOS "._*" metadata are skipped)
+    """
+    with os.scandir(directory_path) as it:
+        return [entry.path for entry in it
+                if not entry.name.startswith('.') and entry.is_file()
+                and os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTS]
+
+def _rotate_one(image_path, angle, overwrite, direction_text):
+    """
+    Rotate a single image and save it (runs in a worker thread).
+    
+    Returns:
+        str: Progress message describing the saved file
+    """
+    # Open image
+    with Image.open(image_path) as img:
+        # Rotate image; a transpose reorders pixels without resampling
+        if angle == 90:
+            rotated_img = img.transpose(Image.Transpose.ROTATE_90)
+        else:
+            rotated_img = img.transpose(Image.Transpose.ROTATE_270)
+        
+        # Save rotated image
+        if overwrite:
+            rotated_img.save(image_path)
+            return f"Rotated {direction_text}: {os.path.basename(image_path)}"
+        
+        # Create new filename with rotation suffix
+        name, ext = os.path.splitext(image_path)
+        new_path = f"{name}_rotated_{direction_text}{ext}"
+        rotated_img.save(new_path)
+        return f"Rotated {direction_text} and saved as: {os.path.basename(new_path)}"
 
 def rotate_images_in_directory(directory_path, direction="anticlockwise", overwrite=True):
     """
@@ -137,10 +374,6 @@ def rotate_images_in_directory(directory_path, direction="anticlockwise", overwr
     Returns:
         int: Number of images rotated
     """
-    if not os.path.exists(directory_path):
-        print(f"Directory not found: {directory_path}")
-        return 0
-    
     # Determine rotation angle based on direction
     if direction.lower() in ["clockwise", "cw"]:
         angle = -90  # Negative for clockwise
@@ -152,14 +385,15 @@ def rotate_images_in_directory(directory_path, direction="anticlockwise", overwr
         print(f"Invalid direction: {direction}. Use 'clockwise' or 'anticlockwise'")
         return 0
     
-    # Supported image formats
-    image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.tiff', '*.webp']
-    image_files = []
-    
     # Find all image files in directory
-    for extension in image_extensions:
-        image_files.extend(glob.glob(os.path.join(directory_path, extension)))
-        image_files.extend(glob.glob(os.path.join(directory_path, extension.upper())))
+    try:
+        image_files = _find_image_files(directory_path)
+    except (FileNotFoundError, NotADirectoryError):
+        print(f"Directory not found: {directory_path}")
+        return 0
+    except OSError:
+        # e.g. an unreadable directory
+        image_files = []
     
     if not image_files:
         print(f"No image files found in: {directory_path}")
@@ -168,31 +402,46 @@ def rotate_images_in_directory(directory_path, direction="anticlockwise", overwr
     print(f"Rotating {len(image_files)} images {direction_text} by 90 degrees...")
     rotated_count = 0
     
-    for image_path in image_files:
-        try:
-            # Open image
-            with Image.open(image_path) as img:
-                # Rotate image
-                rotated_img = img.rotate(angle, expand=True)
-                
-                # Save rotated image
-                if overwrite:
-                    rotated_img.save(image_path)
-                    print(f"Rotated {direction_text}: {os.path.basename(image_path)}")
-                else:
-                    # Create new filename with rotation suffix
-                    name, ext = os.path.splitext(image_path)
-                    new_path = f"{name}_rotated_{direction_text}{ext}"
-                    rotated_img.save(new_path)
-                    print(f"Rotated {direction_text} and saved as: {os.path.basename(new_path)}")
-                
+    # Pillow releases the GIL while decoding, rotating and encoding
+    max_workers = min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_rotate_one, image_path, angle, overwrite, direction_text): image_path
+            for image_path in image_files
+        }
+        
+        for future in as_completed(futures):
+            image_path = futures[future]
+            try:
+                print(future.result())
                 rotated_count += 1
-                
-        except Exception as e:
-            print(f"Error rotating {os.path.basename(image_path)}: {str(e)}")
+            except Exception as e:
+                print(f"Error rotating {os.path.basename(image_path)}: {str(e)}")
     
     return rotated_count
 
+def _page_num(filename):
+    """
+    Parse the page number from a filename following the *_page{N}_* convention.
+    
+    Args:
+        filename (str): Image filename (extension already filtered)
+    
+    Returns:
+        int: Page number, or None if the filename doesn't match the pattern
+    """
+    # Case-insensitive, and the last _page{N}_ occurrence wins
+    name = filename.lower()
+    end = len(name)
+    while True:
+        i = name.rfind('_page', 0, end)
+        if i < 0:
+            return None
+        j = name.find('_', i + 5)
+        if j > i + 5 and name[i + 5:j].isdecimal():
+            return int(name[i + 5:j])
+        end = i
+
 def create_pdf_from_images(directory_path, output_pdf=None):
     """
     Create a PDF from images in a directory, following page numbering convention.
@@ -205,17 +454,15 @@ def create_pdf_from_images(directory_path, output_pdf=None):
     Returns:
         str: Path to created PDF file, or None if failed
     """
-    if not os.path.exists(directory_path):
+    # Find all image files in directory
+    try:
+        image_files = _find_image_files(directory_path)
+    except (FileNotFoundError, NotADirectoryError):
         print(f"Directory not found: {directory_path}")
         return None
-    
-    # Find all image files in directory
-    image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.tiff', '*.webp']
-    image_files = []
-    
-    for extension in image_extensions:
-        image_files.extend(glob.glob(os.path.join(directory_path, extension)))
-        image_files.extend(glob.glob(os.path.join(directory_path, extension.upper())))
+    except OSError:
+        # e.g. an unreadable directory
+        image_files = []
     
     if not image_files:
         print(f"No image files found in: {directory_path}")
@@ -223,14 +470,12 @@ def create_pdf_from_images(directory_path, output_pdf=None):
     
     # Extract page numbers and sort images by page number
     page_images = []
-    page_pattern = re.compile(r'.*_page(\d+)_.*\.(png|jpg|jpeg|gif|bmp|tiff|webp)$', re.IGNORECASE)
     
     for image_path in image_files:
         filename = os.path.basename(image_path)
-        match = page_pattern.match(filename)
+        page_num = _page_num(filename)
         
-        if match:
-            page_num = int(match.group(1))
+        if page_num is not None:
             page_images.append((page_num, image_path))
         else:
             print(f"Warning: Skipping file (doesn't match page pattern): {filename}")
@@ -241,7 +486,7 @@ def create_pdf_from_images(directory_path, output_pdf=None):
         return None
     
     # Sort by page number
-    page_images.sort(key=lambda x: x[0])
+    page_images.sort(key=itemgetter(0))
     
     # Generate output PDF name if not provided
     if output_pdf is None:
@@ -256,22 +501,13 @@ def create_pdf_from_images(directory_path, output_pdf=None):
     print(f"Page range: {page_images[0][0]} to {page_images[-1][0]}")
     
     try:
-        # Create new PDF document
-        pdf_document = fitz.open()
+        # Prepare every page first so the insert loop below stays tight
+        prepared_pages = []
         
         for page_num, image_path in page_images:
             try:
                 # Open image with PIL to ensure compatibility
                 with Image.open(image_path) as img:
-                    # Convert to RGB if necessary (for JPEG compatibility)
-                    if img.mode in ('RGBA', 'LA', 'P'):
-                        img = img.convert('RGB')
-                    
-                    # Save image to bytes
-                    img_bytes = io.BytesIO()
-                    img.save(img_bytes, format='PNG')
-                    img_bytes.seek(0)
-                    
                     # Get image dimensions
                     img_width, img_height = img.size
                     
@@ -280,25 +516,79 @@ def create_pdf_from_images(directory_path, output_pdf=None):
                     page_width = img_width * 72 / 96  # Assuming 96 DPI for screen
                     page_height = img_height * 72 / 96
                     
-                    # Create new page
-                    page = pdf_document.new_page(width=page_width, height=page_height)
+                    ext = os.path.splitext(image_path)[1].lower()
                     
-                    # Insert image to fill the entire page
-                    page.insert_image(fitz.Rect(0, 0, page_width, page_height), stream=img_bytes.getvalue())
+                    if img.mode not in ('RGBA', 'LA', 'P') and ext in _DIRECT_INSERT_EXTS:
+                        # PyMuPDF can embed the file as-is, no re-encoding needed
+                        stream = None
+                    else:
+                        has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+                        
+                        if has_alpha:
+                            # Flatten transparency onto a white page background
+                            rgba = img.convert('RGBA')
+                            img = Image.new('RGB', rgba.size, (255, 255, 255))
+                            img.paste(rgba, mask=rgba.getchannel('A'))
+                        elif img.mode.startswith('I'):
+                            # Scale 16/32-bit grayscale down to 8 bits; a plain
+                            # convert clips everything above 255 to white
+                            img = img.convert('I').point(lambda v: v / 256).convert('L')
+                        elif img.mode not in ('L', 'RGB'):
+                            # Convert to RGB if necessary (for JPEG compatibility)
+                            img = img.convert('RGB')
+                        
+                        # Save image to bytes; JPEG is much faster than PNG
+                        img_bytes = io.BytesIO()
+                        img.save(img_bytes, format='JPEG', quality=85)
+                        stream = img_bytes.getvalue()
                     
-                    print(f"Added page {page_num}: {os.path.basename(image_path)}")
+                    prepared_pages.append((page_num, image_path, page_width, page_height, stream))
                     
             except Exception as e:
                 print(f"Error processing image {os.path.basename(image_path)}: {str(e)}")
                 continue
         
+        # Create new PDF document
+        pdf_document = fitz.open()
+        
+        for page_num, image_path, page_width, page_height, stream in prepared_pages:
+            page = None
+            try:
+                # Create new page
+                page = pdf_document.new_page(width=page_width, height=page_height)
+                
+                # Insert image to fill the entire page
+                page.insert_image(
+                    fitz.Rect(0, 0, page_width, page_height),
+                    filename=image_path if stream is None else None,
+                    stream=stream,
+                    keep_proportion=False,
+                    overlay=False
+                )
+                
+                print(f"Added page {page_num}: {os.path.basename(image_path)}")
+                
+            except Exception as e:
+                # Drop the blank page left behind by a failed insert
+                if page is not None:
+                    pdf_document.delete_page(page.number)
+                print(f"Error processing image {os.path.basename(image_path)}: {str(e)}")
+                continue
+        
         if pdf_document.page_count == 0:
             print("No pages were successfully added to the PDF")
             pdf_document.close()
             return None
         
-        # Save PDF
-        pdf_document.save(output_pdf)
+        # Save PDF; images are already compressed so skip re-deflating them
+        pdf_document.save(
+            output_pdf,
+            deflate=True,
+            deflate_images=False,
+            garbage=4,
+            clean=True,
+            no_new_id=True
+        )
         pdf_document.close()
         
         print(f"\nPDF created successfully: {output_pdf}")
@@ -310,12 +600,123 @@ def create_pdf_from_images(directory_path, output_pdf=None):
         print(f"Error creating PDF: {str(e)}")
         return None
 
+def _render_compressed_page(page, image_quality, max_width, max_height):
+    """
+    Render a single PDF page as a compressed JPEG.
+    
+    Returns:
+        tuple: (jpeg_bytes, width, height) of the rendered image
+    """
+    # Calculate optimal resolution
+    page_rect = page.rect
+    page_width = page_rect.width
+    page_height = page_rect.height
+    
+    # Calculate scale factor to fit within max dimensions; never render
+    # above 1x, as anything larger is only thrown away by the JPEG encode
+    scale = min(max_width / page_width, max_height / page_height, 1.0)
+    
+    # Create transformation matrix
+    mat = fitz.Matrix(scale, scale)
+    
+    # Render page as image at the target size, skipping off-page content
+    pix = page.get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False, clip=page_rect)
+    
+    # Compress image aggressively
+    if image_quality >= 40:
+        # No blur or color reduction needed, encode with MuPDF's libjpeg directly
+        jpeg_bytes = pix.tobytes("jpeg", jpg_quality=image_quality)
+        img_width, img_height = pix.width, pix.height
+    else:
+        # Wrap the pixmap samples in a PIL Image without a PNG round-trip
+        pil_image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+        
+        # Apply additional optimizations
+        # 1. Reduce colors for non-photographic content
+        pil_image = pil_image.quantize(colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+        pil_image = pil_image.convert('RGB')
+        
+        # 2. Apply slight blur to reduce JPEG artifacts at low quality
+        pil_image = pil_image.filter(_LOW_QUALITY_BLUR)
+        
+        # Use progressive JPEG for better compression
+        img_bytes = io.BytesIO()
+        pil_image.save(
+            img_bytes, 
+            format='JPEG', 
+            quality=image_quality,
+            optimize=True,
+            progressive=True,
+            subsampling=2  # Aggressive chroma subsampling for low quality
+        )
+        jpeg_bytes = img_bytes.getvalue()
+        img_width, img_height = pil_image.width, pil_image.height
+    
+    # Clean up
+    pix = None
+    
+    return jpeg_bytes, img_width, img_height
+
+def _render_page_chunk(pdf_path, page_nums, image_quality, max_width, max_height):
+    """
+    Render a contiguous chunk of PDF pages as compressed JPEGs (runs in a
+    worker process). The document is opened once per worker and reused
+    across chunks.
+    
+    Returns:
+        list: (page_num, jpeg_bytes, width, height) for each page, in order
+    """
+    pdf_document = _open_pdf(pdf_path)
+    rendered = []
+    
+    for page_num in page_nums:
+        jpeg_bytes, img_width, img_height = _render_compressed_page(
+            pdf_document[page_num], image_quality, max_width, max_height
+        )
+        rendered.append((page_num, jpeg_bytes, img_width, img_height))
+    
+    return rendered
+
+def _iter_rendered_chunks(pdf_path, page_chunks, max_workers, image_quality, max_width, max_height):
+    """
+    Render page chunks and yield each chunk's results in page order.
+    
+    A single chunk is rendered in-process, as a pool could only use one
+    worker for it. Otherwise chunks are spread across worker processes.
+    
+    Yields:
+        list: (page_num, jpeg_bytes, width, height) for each page of a chunk
+    """
+    if len(page_chunks) <= 1:
+        for page_nums in page_chunks:
+            yield _render_page_chunk(pdf_path, page_nums, image_quality, max_width, max_height)
+        return
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Keep at most 2 * max_workers * _MAX_RENDER_CHUNK_PAGES pages in
+        # flight, so rendered pages waiting to be inserted stay bounded
+        # however long the document is
+        chunk_iter = iter(page_chunks)
+        pending = deque(
+            executor.submit(_render_page_chunk, pdf_path, page_nums, image_quality, max_width, max_height)
+            for page_nums in islice(chunk_iter, max_workers * 2)
+        )
+        
+        while pending:
+            rendered = pending.popleft().result()
+            for page_nums in islice(chunk_iter, 1):
+                pending.append(executor.submit(
+                    _render_page_chunk, pdf_path, page_nums, image_quality, max_width, max_height
+                ))
+            yield rendered
+
 def compress_pdf(input_pdf, output_pdf=None, image_quality=30, max_width=1200, max_height=1600):
     """
     Compress PDF using aggressive optimization and page rendering for 99%+ size reduction.
     
     This method renders each PDF page as a compressed image for maximum size reduction.
     Achieves 99%+ compression ratio by converting pages to optimized JPEG images.
+    Pages are rendered in parallel across worker processes.
     
     Args:
         input_pdf (str): Path to input PDF file
@@ -327,10 +728,6 @@ def compress_pdf(input_pdf, output_pdf=None, image_quality=30, max_width=1200, m
     Returns:
         str: Path to compressed PDF file, or None if failed
     """
-    if not os.path.exists(input_pdf):
-        print(f"PDF file not found: {input_pdf}")
-        return None
-    
     # Generate output PDF name if not provided
     if output_pdf is None:
         name, ext = os.path.splitext(input_pdf)
@@ -346,92 +743,60 @@ def compress_pdf(input_pdf, output_pdf=None, image_quality=30, max_width=1200, m
         print(f"Original PDF size: {original_size / (1024*1024):.2f} MB")
         print(f"Advanced compression settings: Quality={image_quality}%, Max size={max_width}x{max_height}")
         
-        # Open the PDF
-        pdf_document = fitz.open(input_pdf)
+        # Open the PDF to get the page count
+        pdf_document = _open_pdf(input_pdf)
+        page_count = pdf_document.page_count
         
         # Create new PDF document for output
         new_pdf = fitz.open()
         
         print("Rendering pages as compressed images...")
         
-        for page_num in range(pdf_document.page_count):
-            page = pdf_document[page_num]
-            
-            # Calculate optimal resolution
-            page_rect = page.rect
-            page_width = page_rect.width
-            page_height = page_rect.height
-            
-            # Calculate scale factor to fit within max dimensions
-            scale_x = max_width / page_width if page_width > max_width else 1.0
-            scale_y = max_height / page_height if page_height > max_height else 1.0
-            scale = min(scale_x, scale_y, 2.0)  # Cap at 2x for quality
-            
-            # Create transformation matrix
-            mat = fitz.Matrix(scale, scale)
-            
-            # Render page as image
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            
-            # Convert to PIL Image for better compression
-            img_data = pix.tobytes("png")
-            pil_image = Image.open(io.BytesIO(img_data))
-            
-            # Convert to RGB if necessary
-            if pil_image.mode in ('RGBA', 'LA', 'P'):
-                pil_image = pil_image.convert('RGB')
-            
-            # Apply additional optimizations
-            # 1. Reduce colors for non-photographic content
-            if image_quality < 50:
-                # Quantize colors for very low quality settings
-                pil_image = pil_image.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
-                pil_image = pil_image.convert('RGB')
-            
-            # 2. Apply slight blur to reduce JPEG artifacts at low quality
-            if image_quality < 40:
-                from PIL import ImageFilter
-                pil_image = pil_image.filter(ImageFilter.GaussianBlur(radius=0.5))
-            
-            # Compress image aggressively
-            img_bytes = io.BytesIO()
-            
-            # Use progressive JPEG for better compression
-            pil_image.save(
-                img_bytes, 
-                format='JPEG', 
-                quality=image_quality,
-                optimize=True,
-                progressive=True,
-                subsampling=2 if image_quality < 50 else 0  # Aggressive chroma subsampling for low quality
-            )
-            
-            img_bytes.seek(0)
-            
-            # Calculate new page dimensions
-            new_width = pil_image.width * 72 / 96  # Convert to points
-            new_height = pil_image.height * 72 / 96
-            
-            # Create new page and insert compressed image
-            new_page = new_pdf.new_page(width=new_width, height=new_height)
-            new_page.insert_image(fitz.Rect(0, 0, new_width, new_height), stream=img_bytes.getvalue())
-            
-            # Clean up
-            pix = None
+        # Render and encode contiguous page chunks, in worker processes when
+        # there is more than one; each worker opens the document once and
+        # reuses it across chunks. PDF writes stay in this process
+        max_workers = _get_max_workers()
+        chunk_size = min(max(1, -(-page_count // (max_workers * 4))), _MAX_RENDER_CHUNK_PAGES)
+        page_chunks = [range(start, min(start + chunk_size, page_count))
+                       for start in range(0, page_count, chunk_size)]
+        
+        rendered_chunks = _iter_rendered_chunks(
+            input_pdf, page_chunks, max_workers, image_quality, max_width, max_height
+        )
+        
+        for rendered in rendered_chunks:
+            for page_num, jpeg_bytes, img_width, img_height in rendered:
+                # Calculate new page dimensions
+                new_width = img_width * 72 / 96  # Convert to points
+                new_height = img_height * 72 / 96
+                
+                # Create new page and insert compressed image
+                new_page = new_pdf.new_page(width=new_width, height=new_height)
+                new_page.insert_image(
+                    fitz.Rect(0, 0, new_width, new_height),
+                    stream=jpeg_bytes,
+                    keep_proportion=False,
+                    overlay=False
+                )
+                
+                print(f"Processed page {page_num + 1}/{page_count} - Size: {len(jpeg_bytes) / 1024:.1f} KB")
             
-            print(f"Processed page {page_num + 1}/{pdf_document.page_count} - Size: {len(img_bytes.getvalue()) / 1024:.1f} KB")
+            # The images are copied into the PDF, release the chunk before
+            # waiting on the next one
+            del rendered, jpeg_bytes
         
-        # Save with maximum compression settings
+        # Save with maximum compression settings; pages are already JPEG,
+        # so skip re-deflating image streams
         new_pdf.save(
             output_pdf,
             deflate=True,
+            deflate_images=False,
             garbage=4,
             clean=True,
-            pretty=True
+            no_new_id=True
         )
         
         new_pdf.close()
-        pdf_document.close()
         
         # Get compressed file size
         compressed_size = os.path.getsize(output_pdf)
@@ -443,10 +808,53 @@ def compress_pdf(input_pdf, output_pdf=None, image_quality=30, max_width=1200, m
         
         return output_pdf
         
+    except FileNotFoundError:
+        print(f"PDF file not found: {input_pdf}")
+        return None
     except Exception as e:
         print(f"Error in advanced compression: {str(e)}")
         return None
 
+def process_files(paths, command, **kwargs):
+    """
+    Run a PDF command over several files in a single process.
+    
+    Documents opened along the way stay in the per-process cache, so a file
+    visited more than once in a batch is only parsed once.
+    
+    The same keyword arguments are passed for every file, so per-file
+    outputs such as output_pdf can't be given when there are several paths;
+    leave them unset to name each output after its input. A shared
+    output_folder is fine, as extracted images are prefixed with the PDF name.
+    
+    Args:
+        paths (list): Paths to the PDF files
+        command (callable): Function taking a PDF path as its first argument,
+            e.g. extract_images_with_quality_filter or compress_pdf
+        **kwargs: Extra keyword arguments passed to command
+    
+    Returns:
+        dict: Result of command for each path (None if the file was missing,
+        unreadable or not a valid PDF)
+    """
+    if len(paths) > 1 and kwargs.get("output_pdf") is not None:
+        raise ValueError("output_pdf would be shared by every file; leave it unset for batches")
+    
+    results = {}
+    
+    for path in paths:
+        try:
+            results[path] = command(path, **kwargs)
+        except (FileNotFoundError, fitz.FileNotFoundError):
+            print(f"PDF file not found: {path}")
+            results[path] = None
+        except (OSError, RuntimeError) as e:
+            # PyMuPDF errors (FileDataError, EmptyFileError) are RuntimeErrors
+            print(f"Error processing {path}: {str(e)}")
+            results[path] = None
+    
+    return results
+
 def show_help():
     """Display detailed help information for all commands."""
     help_text = """
@@ -580,7 +988,11 @@ def main():
         # PDF extraction mode
         pdf_file = args.path
         
-        if not os.path.exists(pdf_file):
+        # Open the PDF before printing anything else, so a bad path fails
+        # first; the document is cached and reused by the extraction below
+        try:
+            _open_pdf(pdf_file)
+        except (FileNotFoundError, fitz.FileNotFoundError):
             print(f"PDF file not found: {pdf_file}")
             return
         
@@ -605,10 +1017,6 @@ def main():
         # Image rotation mode
         directory_path = args.path
         
-        if not os.path.exists(directory_path):
-            print(f"Directory not found: {directory_path}")
-            return
-        
         # Rotate images
         rotated_count = rotate_images_in_directory(
             directory_path, 
@@ -622,10 +1030,6 @@ def main():
         # PDF creation mode
         directory_path = args.path
         
-        if not os.path.exists(directory_path):
-            print(f"Directory not found: {directory_path}")
-            return
-        
         # Create PDF from images
         output_pdf = create_pdf_from_images(
             directory_path,
@@ -641,10 +1045,6 @@ def main():
         # Advanced PDF compression mode
         pdf_file = args.path
         
-        if not os.path.exists(pdf_file):
-            print(f"PDF file not found: {pdf_file}")
-            return
-        
         # Validate quality parameter
         if not 1 <= args.quality <= 100:
             print("Quality must be between 1 and 100")